@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 from copy import copy
 from types import MappingProxyType
 from typing import TYPE_CHECKING, cast
@@ -49,6 +48,8 @@ class ElementAccumulator:
         self._parser = etree.HTMLPullParser(
             events=("start", "end"),
             tag={x.tag for x in target_tags},
+            # Elements are never looked up by ID, so the ID hash table is not built.
+            collect_ids=False,
         )
 
     @property
@@ -134,9 +135,8 @@ class ElementAccumulator:
         """
         Asynchronously feed HTML chunks into the parser and collect extracted elements.
 
-        Consumes chunks from an async iterator, processing each chunk in a separate
-        thread to avoid blocking. Stops as soon as all target elements have been
-        extracted.
+        Consumes chunks from an async iterator, feeding each chunk to the parser as it
+        arrives. Stops as soon as all target elements have been extracted.
 
         Parameters
         ----------
@@ -150,7 +150,9 @@ class ElementAccumulator:
         """
         elements: list[ETreeElement] = []
         async for chunk in chunks:
-            elements.extend(await asyncio.to_thread(self.feed, chunk))
+            # Parsing stays on the event loop thread; an lxml parser must not be fed
+            # from whichever worker thread happens to pick up a chunk.
+            elements.extend(self.feed(chunk))
             if self.done:
                 break
         return elements
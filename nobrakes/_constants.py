@@ -11,3 +11,6 @@ TA_DOMAIN: Final[str] = "https://ta.svemo.se"
 
 # First season with available data.
 FIRST_AVAILABLE_SEASON: Final[int] = 2011
+
+# Default size (in bytes) of the response body chunks fed to the parser.
+CHUNK_SIZE: Final[int] = 65_536
@@ -1,17 +1,32 @@
-"""Utilities that enable type safe usage of lxml's `ETreeElement.xpath()`."""
+"""
+Utilities that enable type safe usage of lxml's XPath evaluation.
+
+Each function accepts either an XPath expression string, which is evaluated using
+`ETreeElement.xpath()`, or a precompiled `lxml.etree.XPath` object, which is called
+directly and thus avoids reparsing the expression.
+"""
 
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
 from nobrakes.exceptions import ElementError
-from nobrakes.typing._typing import is_element_list, is_str, is_str_list
+from nobrakes.typing._typing import is_element_list, is_str_list
 
 if TYPE_CHECKING:
     from nobrakes.typing import ETreeElement
+    from nobrakes.typing._typing import XPathLike
+
+
+def _evaluate(elem: ETreeElement, xpath: XPathLike) -> object:
+    """Evaluate `xpath` on `elem`."""
+    if isinstance(xpath, str):
+        return elem.xpath(xpath)
+
+    return xpath(elem)
 
 
-def element_list(elem: ETreeElement, xpath: str) -> list[ETreeElement]:
+def element_list(elem: ETreeElement, xpath: XPathLike) -> list[ETreeElement]:
     """
     Evaluate `xpath` on `elem` and return a list of elements.
 
@@ -19,8 +34,8 @@ def element_list(elem: ETreeElement, xpath: str) -> list[ETreeElement]:
     ----------
     elem : ETreeElement
         The element on which to run the XPath query.
-    xpath : str
-        The XPath expression.
+    xpath : XPathLike
+        The XPath expression, or a precompiled `lxml.etree.XPath`.
 
     Returns
     -------
@@ -32,14 +47,14 @@ def element_list(elem: ETreeElement, xpath: str) -> list[ETreeElement]:
     ValueError
         If the XPath result is not a list of elements.
     """
-    if is_element_list(x := elem.xpath(xpath)):
+    if is_element_list(x := _evaluate(elem, xpath)):
         return x
 
     exc_msg = "elem.xpath(xpath) did not return list[ETreeElement]."
     raise ValueError(exc_msg)
 
 
-def string_list(elem: ETreeElement, xpath: str) -> list[str]:
+def string_list(elem: ETreeElement, xpath: XPathLike) -> list[str]:
     """
     Evaluate `xpath` on `elem` and return a list of strings.
 
@@ -47,8 +62,8 @@ def string_list(elem: ETreeElement, xpath: str) -> list[str]:
     ----------
     elem : ETreeElement
         The element on which to run the XPath query.
-    xpath : str
-        The XPath expression.
+    xpath : XPathLike
+        The XPath expression, or a precompiled `lxml.etree.XPath`.
 
     Returns
     -------
@@ -60,14 +75,14 @@ def string_list(elem: ETreeElement, xpath: str) -> list[str]:
     ValueError
         If the XPath result is not a list of strings.
     """
-    if is_str_list(x := elem.xpath(xpath)):
+    if is_str_list(x := _evaluate(elem, xpath)):
         return x
 
     exc_msg = "elem.xpath(xpath) did not return list[str]."
     raise ValueError(exc_msg)
 
 
-def string(elem: ETreeElement, xpath: str) -> str:
+def string(elem: ETreeElement, xpath: XPathLike) -> str:
     """
     Evaluate `xpath` on `elem` and return a single string.
 
@@ -75,8 +90,8 @@ def string(elem: ETreeElement, xpath: str) -> str:
     ----------
     elem : ETreeElement
         The element on which to run the XPath query.
-    xpath : str
-        The XPath expression.
+    xpath : XPathLike
+        The XPath expression, or a precompiled `lxml.etree.XPath`.
 
     Returns
     -------
@@ -88,14 +103,14 @@ def string(elem: ETreeElement, xpath: str) -> str:
     ValueError
         If the XPath result is not a string.
     """
-    if is_str(x := elem.xpath(xpath)):
+    if isinstance(x := _evaluate(elem, xpath), str):
         return x
 
     exc_msg = "elem.xpath(xpath) did not return str."
     raise ValueError(exc_msg)
 
 
-def first_element_d(elem: ETreeElement, xpath: str) -> ETreeElement | None:
+def first_element_d(elem: ETreeElement, xpath: XPathLike) -> ETreeElement | None:
     """
     Return the first element matching `xpath`, or None if none found.
 
@@ -103,8 +118,8 @@ def first_element_d(elem: ETreeElement, xpath: str) -> ETreeElement | None:
     ----------
     elem : ETreeElement
         The element on which to run the XPath query.
-    xpath : str
-        The XPath expression.
+    xpath : XPathLike
+        The XPath expression, or a precompiled `lxml.etree.XPath`.
 
     Returns
     -------
@@ -114,7 +129,7 @@ def first_element_d(elem: ETreeElement, xpath: str) -> ETreeElement | None:
     return elements[0] if (elements := element_list(elem, xpath)) else None
 
 
-def first_element_e(elem: ETreeElement, xpath: str) -> ETreeElement:
+def first_element_e(elem: ETreeElement, xpath: XPathLike) -> ETreeElement:
     """
     Return the first element matching `xpath`.
 
@@ -122,8 +137,8 @@ def first_element_e(elem: ETreeElement, xpath: str) -> ETreeElement:
     ----------
     elem : ETreeElement
         The element on which to run the XPath query.
-    xpath : str
-        The XPath expression.
+    xpath : XPathLike
+        The XPath expression, or a precompiled `lxml.etree.XPath`.
 
     Returns
     -------
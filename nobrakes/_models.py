@@ -12,6 +12,11 @@ class HashableMapping[KT, VT](Mapping[KT, VT]):
     """A hashable wrapper around a mapping."""
 
     _wrapped: Mapping[KT, VT]
+    _hash: int = field(init=False, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Set private fields."""
+        object.__setattr__(self, "_hash", hash(frozenset(self._wrapped.items())))
 
     def __getitem__(self, key: KT) -> VT:
         return self._wrapped[key]
@@ -23,7 +28,7 @@ class HashableMapping[KT, VT](Mapping[KT, VT]):
         return len(self._wrapped)
 
     def __hash__(self) -> int:
-        return hash(frozenset(self._wrapped.items()))
+        return self._hash
 
 
 @dataclass(frozen=True)
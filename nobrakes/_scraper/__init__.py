@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from copy import deepcopy
-from functools import wraps
+from functools import cache, wraps
 import importlib
 from types import MappingProxyType
 from typing import (
@@ -767,6 +767,7 @@ class SVEMOScraper:
         )
 
     @staticmethod
+    @cache
     def _import_pg_module(pg: str) -> PgFetchModuleProtocol:
         """Dynamically import and return a page-fetching module by name."""
         return importlib.import_module(f"nobrakes._scraper.pgfetch.{pg}")
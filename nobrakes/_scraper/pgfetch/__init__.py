@@ -73,5 +73,9 @@ async def extract_elements[K: PgDataLabel | Literal["tab_content", "navbar"]](
         e.add_note(f"URL: {url}")
         raise e
 
+    if len(data) == 1:
+        # A single element needs no reordering.
+        return {data[0]: elements[0]}
+
     indexes = _get_sorting_indexes(target_tags, *data)
     return dict(zip(data, (elements[i] for i in indexes), strict=True))
@@ -4,16 +4,19 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cache
 from itertools import count
 import re
 from types import MappingProxyType
 from typing import TYPE_CHECKING, Final
 
+from lxml import etree
+
 from nobrakes._models import TagSignature
 from nobrakes._scraper.table_browser import TableBrowser
 from nobrakes.exceptions import ElementError, TablePageLimitError
 from nobrakes.typing import ETreeElement, EventsPgDataLabel
-from nobrakes.typing._typing import URL, TBTargetTags, TBXPaths, is_element
+from nobrakes.typing._typing import URL, TBTargetTags, TBXPaths
 
 if TYPE_CHECKING:
     from nobrakes.client._base import SessionAdapter
@@ -34,14 +37,26 @@ _CONFIG: Final[_Config] = _Config(
             tag="table", attrs=MappingProxyType({"class": "rgMasterTable"})
         ),
     ),
+    # Compiled once, as the expressions are evaluated for every table page.
     browser_xpaths=TBXPaths(
-        pagination='.//td[@class="rgPagerCell NextPrevAndNumeric"]',
-        current_page='string(.//a[@class="rgCurrentPage"]/span)',
-        last_visible_page='string(.//div[@class="rgWrap rgNumPart"]//a[last()]/span)',
-        eventtarget='string(.//input[@class="rgPageNext"]/@name)',
+        pagination=etree.XPath('.//td[@class="rgPagerCell NextPrevAndNumeric"]'),
+        current_page=etree.XPath('string(.//a[@class="rgCurrentPage"]/span)'),
+        last_visible_page=etree.XPath(
+            'string(.//div[@class="rgWrap rgNumPart"]//a[last()]/span)'
+        ),
+        eventtarget=etree.XPath('string(.//input[@class="rgPageNext"]/@name)'),
     ),
 )
 
+_PAGESIZE_RE: Final[re.Pattern[str]] = re.compile("&pagesize=[125]0”?")
+
+
+@cache
+def _replace_pagesize(url: URL, pagesize: int) -> URL:
+    """Replace the pagesize parameter of `url`."""
+    # Pagesize defaults to 10 if '”' is not removed.
+    return URL(_PAGESIZE_RE.sub(f"&pagesize={pagesize}", url))
+
 
 async def fetch[K: EventsPgDataLabel](
     session: SessionAdapter,
@@ -51,8 +66,7 @@ async def fetch[K: EventsPgDataLabel](
     pagelimit: int = 10,
 ) -> dict[K, ETreeElement]:
     """Fetch competition page data."""
-    # Replace pagesize parameter. Pagesize defaults to 10 if '”' is not removed.
-    url = URL(re.sub("&pagesize=[125]0”?", f"&pagesize={pagesize}", url))
+    url = _replace_pagesize(url, pagesize)
 
     browser = await TableBrowser(
         session,
@@ -61,25 +75,27 @@ async def fetch[K: EventsPgDataLabel](
         xpaths=_CONFIG.browser_xpaths,
     ).launch()
 
-    rows: list[ETreeElement] = []
+    # Rows of subsequent pages are moved into the <tbody> of the first page.
+    table = browser.table
+    rows: ETreeElement | None = None
     for i in count():
         if not i < pagelimit:
             exc_msg = f"Page limit ({pagelimit}) exceeded."
             raise TablePageLimitError(exc_msg)
 
-        table = browser.table
-        tbody = table.find("./tbody")
-        if not is_element(tbody):
+        tbody = browser.table.find("./tbody")
+        if tbody is None:
             exc_msg = "<table> is missing <tbody>."
             raise ElementError(exc_msg)
 
-        rows.extend(tbody)
-        tbody.clear()
+        if rows is None:
+            rows = tbody
+        else:
+            rows.extend(tbody)
 
         if browser.has_pagination and not browser.on_last_page:
             await browser.next_page()
         else:
-            tbody.extend(rows)
             break
 
     return {data[0]: table}
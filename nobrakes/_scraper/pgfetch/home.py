@@ -4,9 +4,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cache
 from types import MappingProxyType
 from typing import TYPE_CHECKING, Final
 
+from lxml import etree
+
 from nobrakes._element_utils import xpath
 from nobrakes._models import HashableMapping, TagSignature
 from nobrakes._scraper.pgfetch import extract_elements
@@ -27,7 +30,8 @@ if TYPE_CHECKING:
 class _Config:
     target_tags: NamedTargetTags
     tier_alias_records: Mapping[int, list[str]]
-    xpath: Mapping[str, str]
+    xpath: Mapping[str, etree.XPath]
+    href_xpath_templates: Mapping[str, str]
 
 
 _CONFIG: Final[_Config] = _Config(
@@ -44,22 +48,33 @@ _CONFIG: Final[_Config] = _Config(
     tier_alias_records={1: ["Bauhausligan", "Elitserien"], 2: ["Allsvenskan"]},
     xpath={
         # Relative to navbar
-        "results": (
+        "results": etree.XPath(
             './/a[@href="https://www.svemo.se/vara-sportgrenar/start-speedway/'
             'resultat-speedway/"]/../../../div/div'
         ),
         # Relative to results
-        "previous_results": "./div/div/div/div",
+        "previous_results": etree.XPath("./div/div/div/div"),
         # Relative to a direct descendant of previous_results
-        "previous_season": "string(./div/p/button/a)",
+        "previous_season": etree.XPath("string(./div/p/button/a)"),
+    },
+    # Formatted with a tier alias and compiled by `_href_xpaths`. The `[1]` predicate
+    # lets libxml2 stop at the first matching href.
+    href_xpath_templates={
         # Relative to a direct descendant of previous_results
-        "href_previous_season": 'string(./div/div/div/a[text()="{}"]/@href)',
+        "href_previous_season": 'string((./div/div/div/a[text()="{}"]/@href)[1])',
         # Relative to results
-        "href_current_season": 'string(./a[text()="Resultat {}"]/@href)',
+        "href_current_season": 'string((./a[text()="Resultat {}"]/@href)[1])',
     },
 )
 
 
+@cache
+def _href_xpaths(key: str, tier_aliases: tuple[str, ...]) -> tuple[etree.XPath, ...]:
+    """Compile the `key` href XPath template once per tier alias."""
+    template = _CONFIG.href_xpath_templates[key]
+    return tuple(etree.XPath(template.format(alias)) for alias in tier_aliases)
+
+
 def _select_accordion(parent: ETreeElement, key: str) -> ETreeElement:
     try:
         return xpath.first_element_e(parent, _CONFIG.xpath[key])
@@ -72,7 +87,7 @@ def _extract_previous_season_urls(
     previous_results: ETreeElement,
     tier_aliases: list[str],
 ) -> Iterator[tuple[int, URL]]:
-    selectors = tuple(map(_CONFIG.xpath["href_previous_season"].format, tier_aliases))
+    selectors = _href_xpaths("href_previous_season", tuple(tier_aliases))
     for elem in previous_results:
         season = xpath.string(elem, _CONFIG.xpath["previous_season"])
         if not season:
@@ -95,7 +110,7 @@ def _extract_current_season_url(
     results: ETreeElement,
     tier_aliases: list[str],
 ) -> URL:
-    selectors = map(_CONFIG.xpath["href_current_season"].format, tier_aliases)
+    selectors = _href_xpaths("href_current_season", tuple(tier_aliases))
     if href := next((x for s in selectors if (x := xpath.string(results, s))), None):
         return URL(href)
 
@@ -126,7 +141,7 @@ async def fetch[K: int](
     try:
         tier_aliases: list[str] = _CONFIG.tier_alias_records[tier]
         items = _extract_previous_season_urls(previous_results, tier_aliases)
-        urls: dict[int, URL] = dict(sorted(items))
+        urls: dict[int, URL] = dict(items)
     except Exception as exc:
         exc_msg = "Failed fetching URLs to result pages of previous seasons."
         raise FetchError(exc_msg) from exc
@@ -7,6 +7,8 @@ from dataclasses import dataclass
 from types import MappingProxyType
 from typing import TYPE_CHECKING, Final
 
+from lxml import etree
+
 from nobrakes._element_utils import xpath
 from nobrakes._models import HashableMapping, TagSignature
 from nobrakes._scraper.pgfetch import extract_elements
@@ -22,7 +24,7 @@ if TYPE_CHECKING:
 @dataclass
 class _Config:
     target_tags: NamedTargetTags
-    xpath: Mapping[str, str]
+    xpath: Mapping[str, etree.XPath]
 
 
 _CONFIG: Final[_Config] = _Config(
@@ -38,7 +40,7 @@ _CONFIG: Final[_Config] = _Config(
             ),
         },
     ),
-    xpath={"table": "table"},
+    xpath={"table": etree.XPath("table")},
 )
 
 
@@ -49,8 +51,5 @@ async def fetch[K: SquadPgDataLabel](
 ) -> dict[K, ETreeElement]:
     """Fetch squad page data."""
     elements = await extract_elements(session, url, _CONFIG.target_tags, *data)
-
-    for k in elements:
-        elements[k] = xpath.first_element_e(elements[k], _CONFIG.xpath["table"])
-
-    return elements
+    table_xpath = _CONFIG.xpath["table"]
+    return {k: xpath.first_element_e(v, table_xpath) for k, v in elements.items()}
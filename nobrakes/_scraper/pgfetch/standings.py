@@ -7,6 +7,8 @@ from dataclasses import dataclass
 from types import MappingProxyType
 from typing import TYPE_CHECKING, Final
 
+from lxml import etree
+
 from nobrakes._element_utils import xpath
 from nobrakes._models import HashableMapping, TagSignature
 from nobrakes._scraper.pgfetch import extract_elements
@@ -22,7 +24,7 @@ if TYPE_CHECKING:
 @dataclass
 class _Config:
     target_tags: NamedTargetTags
-    xpath: Mapping[str, str]
+    xpath: Mapping[str, etree.XPath]
 
 
 _CONFIG: Final[_Config] = _Config(
@@ -53,9 +55,12 @@ _CONFIG: Final[_Config] = _Config(
             ),
         },
     ),
-    xpath={"table": "table"},
+    xpath={"table": etree.XPath("table")},
 )
 
+# Labels of elements wrapping a play-off <table>.
+_PO_LABELS: Final[frozenset[StandingsPgDataLabel]] = frozenset({"po1", "po2", "po3"})
+
 
 async def fetch[K: StandingsPgDataLabel](
     session: SessionAdapter,
@@ -65,8 +70,8 @@ async def fetch[K: StandingsPgDataLabel](
     """Fetch standings page data."""
     elements = await extract_elements(session, url, _CONFIG.target_tags, *data)
 
-    for k in elements:
-        if k.startswith("po"):
-            elements[k] = xpath.first_element_e(elements[k], "table")
+    table_xpath = _CONFIG.xpath["table"]
+    for k in elements.keys() & _PO_LABELS:
+        elements[k] = xpath.first_element_e(elements[k], table_xpath)
 
     return elements
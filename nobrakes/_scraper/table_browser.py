@@ -2,59 +2,20 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
-from functools import wraps
-from typing import TYPE_CHECKING, Concatenate, Literal, Self, TypedDict, cast
+from typing import TYPE_CHECKING, Final, Self
 
 from nobrakes._accumulator import ElementAccumulator
 from nobrakes._element_utils import xpath
 from nobrakes.exceptions import ElementError
-from nobrakes.typing._typing import URL, TBTargetTags, TBXPaths, is_element
+from nobrakes.typing import ETreeElement
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
-
     from nobrakes.client._base import ResponseAdapter, SessionAdapter
-    from nobrakes.typing import ETreeElement
-
-
-class _ButtonTexts(TypedDict):
-    """XPaths required by the table browser."""
-
-    current_page: str
-    last_visible_page: str
-
+    from nobrakes.typing._typing import URL, TBTargetTags, TBXPaths
 
-def _ensure_launched[T: TableBrowser, **P, R](
-    func: Callable[Concatenate[T, P], R],
-) -> Callable[Concatenate[T, P], R]:
-    """Raise `RuntimeError` if the instance has not been launched."""
 
-    @wraps(func)
-    def wrapper(self: T, *args: P.args, **kwargs: P.kwargs) -> R:
-        if not self._launched:
-            exc_msg = "Method 'launch()' has not been called."
-            raise RuntimeError(exc_msg)
-
-        return func(self, *args, **kwargs)
-
-    return cast("Callable[Concatenate[T, P], R]", wrapper)
-
-
-def _require_pagination[T: TableBrowser, **P, R](
-    func: Callable[Concatenate[T, P], R],
-) -> Callable[Concatenate[T, P], R]:
-    """Raise `ElementError` if pagination controls are missing from the parsed table."""
-
-    @wraps(func)
-    def wrapper(self: T, *args: P.args, **kwargs: P.kwargs) -> R:
-        if self._pagination is None:  # pylint: disable=protected-access
-            exc_msg = "Table has no pagination."
-            raise ElementError(exc_msg)
-
-        return func(self, *args, **kwargs)
-
-    return cast("Callable[Concatenate[T, P], R]", wrapper)
+_NOT_LAUNCHED_MSG: Final[str] = "Method 'launch()' has not been called."
+_NO_PAGINATION_MSG: Final[str] = "Table has no pagination."
 
 
 class TableBrowser:
@@ -70,7 +31,8 @@ class TableBrowser:
     target_tags : TBTargetTags
         Tag signatures used to identify the viewstate and table elements.
     xpaths : TBXPaths
-        XPath expressions used to locate pagination controls and buttons.
+        XPath expressions, or precompiled `lxml.etree.XPath` objects, used to locate
+        pagination controls and buttons.
     """
 
     def __init__(
@@ -93,59 +55,61 @@ class TableBrowser:
         self._table: ETreeElement | None = None
         self._pagination: ETreeElement | None = None
         self._viewstate: str | None = None
-
-        self._button_texts = _ButtonTexts(current_page="", last_visible_page="")
+        self._eventtarget: str = ""
+        self._current_page: str = ""
+        self._last_visible_page: str = ""
 
         self._launched: bool = False
 
+    def _missing_elements_error(self, elements: list[ETreeElement]) -> ExceptionGroup:
+        """Return an exception group listing the required elements that are missing."""
+        found = {elem.tag for elem in elements if isinstance(elem, ETreeElement)}
+        exc_group = ExceptionGroup(
+            "Unable to browse table.",
+            [
+                ElementError(exc_msg)
+                for tag, exc_msg in (
+                    ("input", "Input element containing viewstate."),
+                    ("table", "Entire table."),
+                )
+                if tag not in found
+            ],
+        )
+        exc_group.add_note(f"URL: {self.url}")
+        return exc_group
+
     async def _handle_response(self, response: ResponseAdapter) -> None:
         """Parse the HTTP response, extract key elements and update state."""
         response.raise_for_status()
         chunks = response.iter_chunks()
         elements = await self.accumulator.aiter_feed(chunks)
 
-        raise_exc = [False, False]
-        match len(elements):
-            case 0:
-                raise_exc[0] = True
-                raise_exc[1] = True
-            case 1:
-                i = int(elements[0].tag == "table")
-                j = -1 * (i - 1)
-                raise_exc[i] = not is_element(elements[0])
-                raise_exc[j] = True
-            case 2:
-                raise_exc[0] = not is_element(elements[0])
-                raise_exc[1] = not is_element(elements[1])
-
-        if any(raise_exc):
-            msgs = (
-                "Input element containing viewstate.",
-                "Entire table.",
-                "Table footer.",
-            )
+        match elements:
+            case [ETreeElement() as input_elem, ETreeElement() as table]:
+                self._table = table
+            case _:
+                raise self._missing_elements_error(elements)
 
-            exc_group = ExceptionGroup(
-                "Unable to browse table.",
-                [
-                    ElementError(exc_msg)
-                    for true, exc_msg in zip(raise_exc, msgs, strict=False)
-                    if true
-                ],
-            )
-            exc_group.add_note(f"URL: {self.url}")
-            raise exc_group
-
-        input_elem, self._table = elements
         if val := input_elem.get("value"):
             self._viewstate = val
         else:
             exc_msg = "Missing viewstate value."
             raise ElementError(exc_msg)
 
-        self._pagination = deepcopy(
-            xpath.first_element_d(self._table, self.xpaths["pagination"]),
-        )
+        # The pagination controls are nested in <tfoot>. Removing <tfoot> from the
+        # table detaches the subtree, which lxml keeps alive while referenced.
+        xpaths = self.xpaths
+        pagination = xpath.first_element_d(self._table, xpaths["pagination"])
+        self._pagination = pagination
+
+        # The pagination subtree is small and already parsed, so every value read
+        # from it is extracted up front rather than on first access.
+        if pagination is not None:
+            self._current_page = xpath.string(pagination, xpaths["current_page"])
+            self._last_visible_page = xpath.string(
+                pagination, xpaths["last_visible_page"]
+            )
+            self._eventtarget = xpath.string(pagination, xpaths["eventtarget"])
 
         if (tfoot := self._table.find(".//tfoot")) is not None:
             self._table.remove(tfoot)
@@ -168,7 +132,6 @@ class TableBrowser:
         return self
 
     @property
-    @_ensure_launched
     def table(self) -> ETreeElement:
         """
         Return the current table.
@@ -178,10 +141,12 @@ class TableBrowser:
         RuntimeError
             If `launch()` has not been called.
         """
-        return cast("ETreeElement", self._table)
+        if not self._launched or self._table is None:
+            raise RuntimeError(_NOT_LAUNCHED_MSG)
+
+        return self._table
 
     @property
-    @_ensure_launched
     def has_pagination(self) -> bool:
         """
         Return `True` if the table has pagination controls.
@@ -191,20 +156,24 @@ class TableBrowser:
         RuntimeError
             If `launch()` has not been called.
         """
+        if not self._launched:
+            raise RuntimeError(_NOT_LAUNCHED_MSG)
+
         return self._pagination is not None
 
-    @_ensure_launched
-    @_require_pagination
-    def _extract_button_text(
-        self,
-        key: Literal["last_visible_page", "current_page"],
-    ) -> str:
-        text = xpath.string(cast("ETreeElement", self._pagination), self.xpaths[key])
-        if not text:
-            exc_msg = f"{key.replace('_', ' ').capitalize()} button text not found."
-            raise ElementError(exc_msg)
+    def _button_text(self, text: str, button: str) -> str:
+        """Return `text` if the pagination `button` has text, else raise."""
+        if not self._launched:
+            raise RuntimeError(_NOT_LAUNCHED_MSG)
 
-        return text
+        if self._pagination is None:
+            raise ElementError(_NO_PAGINATION_MSG)
+
+        if text:
+            return text
+
+        exc_msg = f"{button} button text not found."
+        raise ElementError(exc_msg)
 
     @property
     def current_page(self) -> str:
@@ -216,11 +185,7 @@ class TableBrowser:
         RuntimeError
             If `launch()` has not been called.
         """
-        k: Literal["current_page"] = "current_page"
-        if not self._button_texts[k]:
-            self._button_texts[k] = self._extract_button_text(k)
-
-        return self._button_texts[k]
+        return self._button_text(self._current_page, "Current page")
 
     @property
     def last_visible_page(self) -> str:
@@ -232,11 +197,7 @@ class TableBrowser:
         RuntimeError
             If `launch()` has not been called.
         """
-        k: Literal["last_visible_page"] = "last_visible_page"
-        if not self._button_texts[k]:
-            self._button_texts[k] = self._extract_button_text(k)
-
-        return self._button_texts[k]
+        return self._button_text(self._last_visible_page, "Last visible page")
 
     @property
     def on_last_page(self) -> bool:
@@ -250,8 +211,6 @@ class TableBrowser:
         """
         return self.current_page == self.last_visible_page
 
-    @_ensure_launched
-    @_require_pagination
     async def next_page(self) -> None:
         """
         Navigate to the next page by submitting a POST request with form data.
@@ -263,18 +222,17 @@ class TableBrowser:
         ElementError
             If required DOM elements are missing.
         """
-        eventtarget = xpath.string(
-            cast("ETreeElement", self._pagination),
-            self.xpaths["eventtarget"],
-        )
-        if not eventtarget:
+        if not self._launched:
+            raise RuntimeError(_NOT_LAUNCHED_MSG)
+
+        if self._pagination is None:
+            raise ElementError(_NO_PAGINATION_MSG)
+
+        if not self._eventtarget:
             exc_msg = "Eventtarget not found."
             raise ElementError(exc_msg)
 
-        form_data = {"__EVENTTARGET": eventtarget, "__VIEWSTATE": self._viewstate}
+        form_data = {"__EVENTTARGET": self._eventtarget, "__VIEWSTATE": self._viewstate}
 
         async with self.session.post(self.url, data=form_data) as response:
             await self._handle_response(response)
-
-        self._button_texts["current_page"] = ""
-        self._button_texts["last_visible_page"] = ""
@@ -24,15 +24,34 @@ DummyCookieJar
     HTTP responses.
 """
 
+from typing import TYPE_CHECKING
+
+from nobrakes.client import _support
 from nobrakes.client._base import ResponseAdapter, SessionAdapter
-from nobrakes.client._support import (
-    AIOHTTPResponseAdapter,
-    AIOHTTPSessionAdapter,
-    HTTPXResponseAdapter,
-    HTTPXSessionAdapter,
-)
 from nobrakes.client._utils import DummyCookieJar
 
+if TYPE_CHECKING:
+    from nobrakes.client._support import (
+        AIOHTTPResponseAdapter,
+        AIOHTTPSessionAdapter,
+        HTTPXResponseAdapter,
+        HTTPXSessionAdapter,
+    )
+
+
+def __getattr__(name: str) -> object:
+    # Defer to `_support`, which imports the HTTP library on first access.
+    if name in _support.__all__:
+        return getattr(_support, name)
+
+    exc_msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(exc_msg)
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
+
 __all__ = [
     "AIOHTTPResponseAdapter",
     "AIOHTTPSessionAdapter",
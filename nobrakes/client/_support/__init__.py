@@ -1,14 +1,16 @@
 """
 Concrete implementations of the abstract adapters in `nobrakes/session/_base.py`.
 
-This module conditionally imports adapter classes for supported HTTP libraries
-(e.g., aiohttp, httpx). If a required library is not installed, an
-ImportError is raised when the missing class is accessed.
+Adapter classes for supported HTTP libraries (e.g., aiohttp, httpx) are imported
+lazily, on first attribute access, so that importing `nobrakes` does not import
+any HTTP library. If a required library is not installed, an ImportError is raised
+when the missing class is accessed.
 """
 
 from collections.abc import Callable
-from importlib.util import find_spec
-from typing import TYPE_CHECKING, NoReturn
+import importlib
+import importlib.util
+from typing import TYPE_CHECKING, Final, NoReturn
 
 
 def _missing(dep: str, cls: str) -> Callable:
@@ -31,24 +33,33 @@ if TYPE_CHECKING:
         HTTPXResponseAdapter,
         HTTPXSessionAdapter,
     )
-else:
-    if find_spec("aiohttp") is not None:
-        from nobrakes.client._support.aiohttp import (
-            AIOHTTPResponseAdapter,
-            AIOHTTPSessionAdapter,
-        )
-    else:
-        AIOHTTPResponseAdapter = _missing("aiohttp", "AIOHTTPResponseAdapter")
-        AIOHTTPSessionAdapter = _missing("aiohttp", "AIOHTTPSessionAdapter")
 
-    if find_spec("httpx") is not None:
-        from nobrakes.client._support.httpx import (
-            HTTPXResponseAdapter,
-            HTTPXSessionAdapter,
-        )
+_ADAPTER_DEPS: Final[dict[str, str]] = {
+    "AIOHTTPResponseAdapter": "aiohttp",
+    "AIOHTTPSessionAdapter": "aiohttp",
+    "HTTPXResponseAdapter": "httpx",
+    "HTTPXSessionAdapter": "httpx",
+}
+
+
+def __getattr__(name: str) -> object:
+    if (dep := _ADAPTER_DEPS.get(name)) is None:
+        exc_msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(exc_msg)
+
+    if importlib.util.find_spec(dep) is None:
+        attr = _missing(dep, name)
     else:
-        HTTPXResponseAdapter = _missing("httpx", "HTTPXResponseAdapter")
-        HTTPXSessionAdapter = _missing("httpx", "HTTPXSessionAdapter")
+        attr = getattr(importlib.import_module(f"{__name__}.{dep}"), name)
+
+    # Subsequent lookups hit the module dict and bypass `__getattr__`.
+    globals()[name] = attr
+    return attr
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
 
 __all__ = [
     "AIOHTTPResponseAdapter",
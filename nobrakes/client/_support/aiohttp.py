@@ -16,6 +16,7 @@ from typing import override
 
 import aiohttp
 
+from nobrakes._constants import CHUNK_SIZE
 from nobrakes.client._base import ResponseAdapter, SessionAdapter
 
 __all__ = ["AIOHTTPResponseAdapter", "AIOHTTPSessionAdapter"]
@@ -30,12 +31,7 @@ class AIOHTTPResponseAdapter(ResponseAdapter["aiohttp.ClientResponse"]):
 
     @override
     def iter_chunks(self) -> AsyncIterator[bytes]:
-        async def _iter_chunks() -> AsyncIterator[bytes]:
-            """Arbitrary chunk size."""
-            async for data, _ in self.adaptee.content.iter_chunks():
-                yield data
-
-        return _iter_chunks()
+        return self.adaptee.content.iter_chunked(CHUNK_SIZE)
 
     @override
     def iter_lines(self) -> AsyncIterator[bytes]:
@@ -46,6 +42,14 @@ class AIOHTTPResponseAdapter(ResponseAdapter["aiohttp.ClientResponse"]):
         return await self.adaptee.read()
 
 
+@asynccontextmanager
+async def _request(
+    session: aiohttp.ClientSession, method: str, url: str, kwargs: dict
+) -> AsyncIterator[AIOHTTPResponseAdapter]:
+    async with session.request(method, url, **kwargs) as response:
+        yield AIOHTTPResponseAdapter(response)
+
+
 class AIOHTTPSessionAdapter(
     SessionAdapter[aiohttp.ClientSession, aiohttp.ClientResponse],
 ):
@@ -53,7 +57,8 @@ class AIOHTTPSessionAdapter(
 
     @override
     def __init__(self, adaptee: aiohttp.ClientSession) -> None:
-        adaptee._cookie_jar = aiohttp.DummyCookieJar()  # noqa: SLF001
+        if not isinstance(adaptee.cookie_jar, aiohttp.DummyCookieJar):
+            adaptee._cookie_jar = aiohttp.DummyCookieJar()  # noqa: SLF001
         super().__init__(adaptee)
 
     @override
@@ -63,14 +68,9 @@ class AIOHTTPSessionAdapter(
         url: str,
         **kwargs,
     ) -> AbstractAsyncContextManager[AIOHTTPResponseAdapter]:
-        @asynccontextmanager
-        async def context_manager() -> AsyncIterator[AIOHTTPResponseAdapter]:
-            async with self.adaptee.request(method, url, **kwargs) as response:
-                yield AIOHTTPResponseAdapter(response)
+        return _request(self.adaptee, method, url, kwargs)
 
-        return context_manager()
-
-    @override
     @property
+    @override
     def headers(self) -> MutableMapping:
         return self.adaptee.headers
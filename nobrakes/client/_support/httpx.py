@@ -17,12 +17,44 @@ from typing import override
 
 import httpx
 
+from nobrakes._constants import CHUNK_SIZE
 from nobrakes.client._base import ResponseAdapter, SessionAdapter
 from nobrakes.client._utils import DummyCookieJar
 
 __all__ = ["HTTPXResponseAdapter", "HTTPXSessionAdapter"]
 
 
+async def _split_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Split a stream of bytes into lines, without decoding it."""
+    # Pieces of an unterminated line, joined once its line break arrives, so that
+    # each chunk is only split once, however many chunks a line spans.
+    tail: list[bytes] = []
+    after_cr = False
+    async for chunk in chunks:
+        if not chunk:
+            continue
+
+        if after_cr and chunk.startswith(b"\n"):
+            # The "\r" ending the previous chunk already terminated the line.
+            chunk = chunk[1:]  # noqa: PLW2901
+
+        after_cr = chunk.endswith(b"\r")
+        lines = chunk.splitlines(keepends=True)
+        last = lines.pop() if lines and not lines[-1].endswith((b"\r", b"\n")) else b""
+        for line in lines:
+            if tail:
+                tail.append(line)
+                line = b"".join(tail)  # noqa: PLW2901
+                tail.clear()
+            yield line.rstrip(b"\r\n")
+
+        if last:
+            tail.append(last)
+
+    if tail:
+        yield b"".join(tail)
+
+
 class HTTPXResponseAdapter(ResponseAdapter["httpx.Response"]):
     """Adapter for `httpx.Response`."""
 
@@ -32,21 +64,25 @@ class HTTPXResponseAdapter(ResponseAdapter["httpx.Response"]):
 
     @override
     def iter_chunks(self) -> AsyncIterator[bytes]:
-        return self.adaptee.aiter_bytes()
+        return self.adaptee.aiter_bytes(CHUNK_SIZE)
 
     @override
     def iter_lines(self) -> AsyncIterator[bytes]:
-        async def _iter_lines() -> AsyncIterator[bytes]:
-            async for line in self.adaptee.aiter_lines():
-                yield line.encode("utf-8")
-
-        return _iter_lines()
+        return _split_lines(self.adaptee.aiter_bytes())
 
     @override
     async def read(self) -> bytes:
         return await self.adaptee.aread()
 
 
+@asynccontextmanager
+async def _stream(
+    client: httpx.AsyncClient, method: str, url: str, kwargs: dict
+) -> AsyncIterator[HTTPXResponseAdapter]:
+    async with client.stream(method, url, **kwargs) as response:
+        yield HTTPXResponseAdapter(response)
+
+
 class HTTPXSessionAdapter(SessionAdapter[httpx.AsyncClient, httpx.Response]):
     """Adapter for `httpx.AsyncClient`."""
 
@@ -63,14 +99,9 @@ class HTTPXSessionAdapter(SessionAdapter[httpx.AsyncClient, httpx.Response]):
         url: str,
         **kwargs,
     ) -> AbstractAsyncContextManager[HTTPXResponseAdapter]:
-        @asynccontextmanager
-        async def context_manager() -> AsyncIterator[HTTPXResponseAdapter]:
-            async with self.adaptee.stream(method, url, **kwargs) as response:
-                yield HTTPXResponseAdapter(response)
+        return _stream(self.adaptee, method, url, kwargs)
 
-        return context_manager()
-
-    @override
     @property
+    @override
     def headers(self) -> MutableMapping:
         return self.adaptee.headers
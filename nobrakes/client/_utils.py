@@ -10,6 +10,9 @@ from typing import TYPE_CHECKING, override
 if TYPE_CHECKING:
     from collections.abc import Awaitable
 
+# Bound once, as `with_jitter` may be awaited for every request.
+_random = random.random
+
 
 class DummyCookieJar(http.cookiejar.CookieJar):
     """A cookie jar that inhibits cookie extraction from HTTP responses."""
@@ -59,5 +62,5 @@ async def with_jitter[R](tmin: float, tmax: float, coro: Awaitable[R]) -> R:
         The result of the awaited coroutine.
 
     """
-    await asyncio.sleep(random.uniform(tmin, tmax))
+    await asyncio.sleep(tmin + (tmax - tmin) * _random())
     return await coro
@@ -83,6 +83,8 @@ type PgCache = dict[TabPgKey, "PgData"]
 
 type NamedTargetTags = "HashableMapping[str, TagSignature]"
 
+type XPathLike = str | etree.XPath
+
 # === Protocols ===
 
 
@@ -105,10 +107,10 @@ class PgFetchModuleProtocol[T](Protocol):
 class TBXPaths(TypedDict):
     """XPaths required by `._scraper.table_browser.TableBrowser`."""
 
-    pagination: str
-    current_page: str
-    last_visible_page: str
-    eventtarget: str
+    pagination: XPathLike
+    current_page: XPathLike
+    last_visible_page: XPathLike
+    eventtarget: XPathLike
 
 
 class TBTargetTags(TypedDict):
@@ -123,17 +125,17 @@ class TBTargetTags(TypedDict):
 
 def is_str_list(obj: object) -> TypeGuard[list[str]]:
     """Return True if obj is a `list` of `str`."""
-    return is_list(obj) and all(isinstance(x, str) for x in obj)
+    return isinstance(obj, list) and all(isinstance(x, str) for x in obj)
 
 
 def is_str_tuple(obj: object) -> TypeGuard[tuple[str, ...]]:
     """Return True if obj is a `tuple` of `str`."""
-    return is_tuple(obj) and all(isinstance(x, str) for x in obj)
+    return isinstance(obj, tuple) and all(isinstance(x, str) for x in obj)
 
 
 def is_element_list(obj: object) -> TypeGuard[list[ETreeElement]]:
     """Return True if obj is a `list` of `etree._Element`."""
-    return is_list(obj) and all(isinstance(x, ETreeElement) for x in obj)
+    return isinstance(obj, list) and all(isinstance(x, ETreeElement) for x in obj)
 
 
 def is_str(obj: object) -> TypeGuard[str]:
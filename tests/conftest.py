@@ -1,12 +1,14 @@
 """"""
 
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Mapping
+from functools import cache
 import html
 import json
 from pathlib import Path
-import re
+from types import MappingProxyType
 
 from lxml import etree
+from lxml.html import fragment_fromstring
 import pytest
 
 from nobrakes.typing import ETreeElement
@@ -14,40 +16,41 @@ from nobrakes.typing import ETreeElement
 DATA_DIR = Path(__file__).parent / "testdata"
 
 
-_INVALID_URL_CHAR_RE = re.compile(r"�|”|ï|¿|½")
+_INVALID_URL_CHARS = "\ufffd”ï¿½"
+_INVALID_URL_CHAR_TABLE = str.maketrans("", "", _INVALID_URL_CHARS)
+_MARKUP_STRIP_TABLE = str.maketrans("", "", _INVALID_URL_CHARS + "\n\r\t")
 
 
 def normalize_url(url: str) -> str:
-    return _INVALID_URL_CHAR_RE.sub("", url)
-
-
-_WHITESPACE_RE = re.compile(r"[\n\r\t]+")
+    return url.translate(_INVALID_URL_CHAR_TABLE)
 
 
 def normalize_markup(text: bytes | str) -> str:
     if isinstance(text, bytes):
         text = text.decode("utf-8", errors="ignore")
 
-    text = html.unescape(text)
-    text = normalize_url(text)
-    text = _WHITESPACE_RE.sub("", text)
+    return html.unescape(text).translate(_MARKUP_STRIP_TABLE).strip()
+
 
-    return text.strip()
+# A plain `etree.HTMLParser` yields `etree._Element`s, like the parser under test.
+_HTML_PARSER = etree.HTMLParser()
 
 
 def element_from_markup(markup: str) -> ETreeElement:
-    root = re.search(r"[^<>\s]+", markup).group()
-    return etree.fromstring(markup, parser=etree.HTMLParser()).find(f".//{root}")
+    return fragment_fromstring(markup.strip(), parser=_HTML_PARSER)
+
+
+@cache
+def _load_pgfetch_output(filename: str) -> Mapping[str, str]:
+    path = DATA_DIR / f"pgfetch_output/{filename}.json"
+    with path.open() as f:
+        # Read-only, as the same mapping is shared by every test that loads it.
+        return MappingProxyType(json.load(f))
 
 
 @pytest.fixture
 def load_pgfetch_output():
-    def _load(filename: str) -> dict[str, str]:
-        path = DATA_DIR / f"pgfetch_output/{filename}.json"
-        with path.open() as f:
-            return json.load(f)
-
-    return _load
+    return _load_pgfetch_output
 
 
 class _ACMMixin:
@@ -58,74 +61,85 @@ class _ACMMixin:
         pass
 
 
-@pytest.fixture
-def make_mock_response():
-    def _make(*, markup=b"", status_code=200):
-        class MockResponse(_ACMMixin):
-            def __init__(self):
-                self.status_code = status_code
+class MockResponse(_ACMMixin):
+    def __init__(self, markup: str | bytes = b"", status_code: int = 200):
+        self.status_code = status_code
+        self._markup = markup
+        self._lines: list[str] | list[bytes] | None = None
 
-            async def read(self) -> bytes:
-                return markup
+    async def read(self) -> str | bytes:
+        return self._markup
 
-            def iter_chunks(self, *_, **__) -> AsyncIterator[bytes]:
-                async def iterator():
-                    chunksize = 1024
-                    nchunks = len(markup) // chunksize + 1
-                    for i in range(nchunks):
-                        yield markup[i * chunksize : i * chunksize + chunksize]
+    def iter_chunks(self, *_, **__) -> AsyncIterator[str | bytes]:
+        async def iterator():
+            chunksize = 1024
+            for i in range(0, len(self._markup), chunksize):
+                yield self._markup[i : i + chunksize]
 
-                return iterator()
+        return iterator()
 
-            def iter_lines(self) -> AsyncIterator[bytes]:
-                async def iterator():
-                    for chunk in markup.splitlines():
-                        yield chunk
+    def iter_lines(self) -> AsyncIterator[str | bytes]:
+        # Split lazily, as most tests never iterate over lines.
+        if self._lines is None:
+            self._lines = self._markup.splitlines()
 
-                return iterator()
+        async def iterator():
+            for line in self._lines:
+                yield line
 
-            def raise_for_status(self):
-                if self.status_code >= 400:
-                    exc_msg = f"HTTP error {self.status_code}"
-                    raise Exception(exc_msg)
+        return iterator()
 
-        return MockResponse()
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            exc_msg = f"HTTP error {self.status_code}"
+            raise Exception(exc_msg)
 
-    return _make
 
+class MockSession(_ACMMixin):
+    def __init__(self, headers: dict | None, response_by_method: dict[str, dict]):
+        self.headers = headers or {}
+        self._response_by_method = response_by_method
 
-@pytest.fixture
-def make_mock_session(make_mock_response):
-    def _make(headers: dict | None = None, **response_by_method):
-        class MockSession(_ACMMixin):
-            def __init__(self):
-                self.headers = headers or {}
+    def _respond(self, method: str) -> MockResponse:
+        return MockResponse(**self._response_by_method.get(method, {}))
+
+    def request(self, *_, **__):
+        return self._respond("request")
+
+    def get(self, *_, **__):
+        return self._respond("get")
 
-            def request(self, *_, **__):
-                return make_mock_response(**response_by_method.get("request", {}))
+    def post(self, *_, **__):
+        return self._respond("post")
 
-            def get(self, *_, **__):
-                return make_mock_response(**response_by_method.get("get", {}))
+    def put(self, *_, **__):
+        return self._respond("put")
 
-            def post(self, *_, **__):
-                return make_mock_response(**response_by_method.get("post", {}))
+    def delete(self, *_, **__):
+        return self._respond("delete")
 
-            def put(self, *_, **__):
-                return make_mock_response(**response_by_method.get("put", {}))
+    def head(self, *_, **__):
+        return self._respond("head")
 
-            def delete(self, *_, **__):
-                return make_mock_response(**response_by_method.get("delete", {}))
+    def options(self, *_, **__):
+        return self._respond("options")
 
-            def head(self, *_, **__):
-                return make_mock_response(**response_by_method.get("head", {}))
+    def patch(self, *_, **__):
+        return self._respond("patch")
 
-            def options(self, *_, **__):
-                return make_mock_response(**response_by_method.get("options", {}))
 
-            def patch(self, *_, **__):
-                return make_mock_response(**response_by_method.get("patch", {}))
+@pytest.fixture
+def make_mock_response():
+    def _make(*, markup=b"", status_code=200):
+        return MockResponse(markup, status_code)
 
-        return MockSession()
+    return _make
+
+
+@pytest.fixture
+def make_mock_session():
+    def _make(headers: dict | None = None, **response_by_method):
+        return MockSession(headers, response_by_method)
 
     return _make
 
@@ -1,5 +1,6 @@
 """Tests for `nobrakes._scraper.pgfetch`."""
 
+from functools import cache
 import re
 from typing import get_args
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
@@ -31,13 +32,15 @@ from tests.conftest import DATA_DIR, normalize_markup, normalize_url
 SUBPKGPATH = "nobrakes._scraper.pgfetch"
 
 
+@cache
+def _load_markup(filename: str) -> str:
+    path = DATA_DIR / f"markup/{filename}.html"
+    return path.read_text("utf-8")
+
+
 @pytest.fixture
 def load_markup():
-    def _load(filename: str) -> str:
-        path = DATA_DIR / f"markup/{filename}.html"
-        return path.read_text("utf-8")
-
-    return _load
+    return _load_markup
 
 
 @pytest.fixture
@@ -110,6 +113,26 @@ async def test_extract_elements_returns_elements(named_target_tags, mock_session
     assert result == named_target_tags._wrapped
 
 
+@pytest.mark.asyncio
+async def test_extract_elements_skips_sorting_for_single_label(
+    named_target_tags, mock_session
+):
+    mock_accumulator = Mock()
+    mock_accumulator.remaining = ()
+    mock_accumulator.aiter_feed = AsyncMock(return_value=["element1"])
+
+    with (
+        patch(f"{SUBPKGPATH}.ElementAccumulator", return_value=mock_accumulator),
+        patch(f"{SUBPKGPATH}._get_sorting_indexes") as mock_get_sorting_indexes,
+    ):
+        result = await pgfetch.extract_elements(
+            mock_session, "https://example.com", named_target_tags, "label1"
+        )
+
+    mock_get_sorting_indexes.assert_not_called()
+    assert result == {"label1": "element1"}
+
+
 @pytest.mark.parametrize(
     ("module", "filename", "labels"),
     [
@@ -171,6 +194,14 @@ class TestFetchHome:
         ):
             home._select_accordion(mock_element, key)
 
+    def test_href_xpaths_compiles_once_per_tier_alias(self):
+        aliases = ("Bauhausligan", "Elitserien")
+        xpaths = home._href_xpaths("href_current_season", aliases)
+        assert [x.path for x in xpaths] == [
+            f'string((./a[text()="Resultat {alias}"]/@href)[1])' for alias in aliases
+        ]
+        assert home._href_xpaths("href_current_season", aliases) is xpaths
+
     def test_extract_previous_season_urls_raises_if_not_season(self):
         exc_msg = "Failed to extract season from hyperlink text."
         with (
@@ -183,7 +214,7 @@ class TestFetchHome:
         tier_alias = "League Name"
 
         def mock_xpath_string(_, selector):
-            return None if tier_alias in selector else "season"
+            return None if tier_alias in selector.path else "season"
 
         exc_msg = "Failed to extract URL from hyperlink href."
         with (
@@ -338,6 +369,19 @@ class TestFetchResults:
         assert actual_output == expected_output
 
 
+@pytest.mark.parametrize(
+    "url",
+    [
+        "http://example.com/?id=1&pagesize=10",
+        "http://example.com/?id=1&pagesize=20”",
+        "http://example.com/?id=1&pagesize=50”",
+    ],
+)
+def test_replace_pagesize_replaces_pagesize(url):
+    expected = "http://example.com/?id=1&pagesize=25"
+    assert events._replace_pagesize(url, 25) == expected
+
+
 @pytest.mark.asyncio
 class TestFetchEvents:
     @pytest.fixture
@@ -1,7 +1,6 @@
 """Tests for `nobrakes._scraper.__init__`."""
 
 import asyncio
-from copy import deepcopy
 import re
 import sys
 import types
@@ -54,7 +53,8 @@ def launch_scraper() -> _scraper.SVEMOScraper:
 async def launched_scraper(
     launch_scraper, initialized_scraper
 ) -> _scraper.SVEMOScraper:
-    return await launch_scraper(deepcopy(initialized_scraper))
+    # `initialized_scraper` is function-scoped, so it is never shared between tests.
+    return await launch_scraper(initialized_scraper)
 
 
 @pytest.mark.asyncio
@@ -95,17 +95,10 @@ async def test_launch_updates_session_headers(launch_scraper, lib, client_name):
         assert not expected_headers.items() - scraper._session.headers.items()
 
 
-@pytest.mark.parametrize(
-    ("lib", "client_name"), [(aiohttp, "ClientSession"), (httpx, "AsyncClient")]
-)
 @pytest.mark.asyncio
-async def test_launch_updates_url_cache(launch_scraper, lib, client_name):
+async def test_launch_updates_url_cache(launched_scraper):
     expected = {("events", 2023): "https://example.com/2023/events"}
-
-    async with getattr(lib, client_name)() as session:
-        scraper = _scraper.SVEMOScraper(session)
-        await launch_scraper(scraper)
-        assert scraper._url_cache == expected
+    assert launched_scraper._url_cache == expected
 
 
 @pytest.mark.asyncio
@@ -375,6 +368,15 @@ async def test_get_method_returns_pg_data(
         assert await method(*data_labels, season=2011) == method_name
 
 
+@pytest.fixture
+def clear_pg_module_cache():
+    # `_import_pg_module` caches process-wide; keep test modules out of the cache.
+    _scraper.SVEMOScraper._import_pg_module.cache_clear()
+    yield
+    _scraper.SVEMOScraper._import_pg_module.cache_clear()
+
+
+@pytest.mark.usefixtures("clear_pg_module_cache")
 def test_import_pg_module_returns_module(monkeypatch):
     dummy_module = types.SimpleNamespace()
     monkeypatch.setitem(sys.modules, "nobrakes._scraper.pgfetch.testpg", dummy_module)
@@ -383,6 +385,17 @@ def test_import_pg_module_returns_module(monkeypatch):
     assert result is dummy_module
 
 
+@pytest.mark.usefixtures("clear_pg_module_cache")
+def test_import_pg_module_imports_once():
+    dummy_module = types.SimpleNamespace()
+    with patch("importlib.import_module", return_value=dummy_module) as mock_import:
+        first = _scraper.SVEMOScraper._import_pg_module("cachedpg")
+        second = _scraper.SVEMOScraper._import_pg_module("cachedpg")
+
+    assert first is second is dummy_module
+    mock_import.assert_called_once_with("nobrakes._scraper.pgfetch.cachedpg")
+
+
 def test_get_hyperlink_href_returns_href():
     elem = etree.fromstring("""<td><a href="http://example.com">Link</a></td>""")
     assert _scraper._get_hyperlink_href(elem) == "http://example.com"
@@ -1,33 +1,49 @@
 """Tests for `nobrakes._scraper.table_browser`."""
 
 from copy import deepcopy
+from functools import cache
 import re
 from unittest.mock import AsyncMock, Mock, patch
 
+from lxml import etree
 import pytest
 
 from nobrakes._models import TagSignature
-from nobrakes._scraper.table_browser import TableBrowser, TBTargetTags, TBXPaths
+from nobrakes._scraper.table_browser import TableBrowser
 from nobrakes.exceptions import (
     ElementError,
 )
 from nobrakes.typing import ETreeElement
+from nobrakes.typing._typing import TBTargetTags, TBXPaths
 from tests.conftest import element_from_markup
 
 MODULEPATH = "nobrakes._scraper.table_browser"
 
 
-@pytest.fixture
+@cache
+def _parse_markup(markup: str) -> ETreeElement:
+    return element_from_markup(markup)
+
+
+def fresh_element(markup: str) -> ETreeElement:
+    # Each markup string is parsed once; tests get a copy they are free to mutate.
+    return deepcopy(_parse_markup(markup))
+
+
+@pytest.fixture(scope="module")
 def browser_xpaths():
+    # Precompiled, as in `nobrakes._scraper.pgfetch.events`.
     return TBXPaths(
-        pagination='.//td[@class="rgPagerCell NextPrevAndNumeric"]',
-        current_page='string(.//a[@class="rgCurrentPage"]/span)',
-        last_visible_page='string(.//div[@class="rgWrap rgNumPart"]//a[last()]/span)',
-        eventtarget='string(.//input[@class="rgPageNext"]/@name)',
+        pagination=etree.XPath('.//td[@class="rgPagerCell NextPrevAndNumeric"]'),
+        current_page=etree.XPath('string(.//a[@class="rgCurrentPage"]/span)'),
+        last_visible_page=etree.XPath(
+            'string(.//div[@class="rgWrap rgNumPart"]//a[last()]/span)'
+        ),
+        eventtarget=etree.XPath('string(.//input[@class="rgPageNext"]/@name)'),
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def browser_target_tags():
     return TBTargetTags(
         viewstate=TagSignature(tag="input", attrs={"id": "__VIEWSTATE"}),
@@ -37,7 +53,7 @@ def browser_target_tags():
 
 @pytest.fixture
 def viewstate():
-    return element_from_markup(
+    return fresh_element(
         """<input name="__VIEWSTATE" id="__VIEWSTATE" value="abc+pg1...xyz">"""
     )
 
@@ -108,7 +124,7 @@ def table_pg1(next_page_button):
     )
 
     table = TABLE_TEMPLATE.format(pagination=pagination)
-    return element_from_markup(table)
+    return fresh_element(table)
 
 
 @pytest.fixture
@@ -119,12 +135,12 @@ def table_pg4(next_page_button):
     )
 
     table = TABLE_TEMPLATE.format(pagination=pagination)
-    return element_from_markup(table)
+    return fresh_element(table)
 
 
 @pytest.fixture
 def table_no_pagination():
-    return element_from_markup(TABLE_TEMPLATE.format(pagination=""))
+    return fresh_element(TABLE_TEMPLATE.format(pagination=""))
 
 
 @pytest.fixture
@@ -142,7 +158,7 @@ def table_no_pagination_button_text(next_page_button):
     )
 
     table = TABLE_TEMPLATE.format(pagination=pagination)
-    return element_from_markup(table)
+    return fresh_element(table)
 
 
 @pytest.fixture
@@ -152,35 +168,33 @@ def table_no_next_page_button():
     )
 
     table = TABLE_TEMPLATE.format(pagination=pagination)
-    return element_from_markup(table)
+    return fresh_element(table)
+
+
+ACCUMULATOR_VARIANTS = {
+    "pg1": ("viewstate", "table_pg1"),
+    "pg4": ("viewstate", "table_pg4"),
+    "no_viewstate": ("table_pg1",),
+    "no_table": ("viewstate",),
+    "no_viewstate_value": ("viewstate_no_value", "table_pg1"),
+    "empty": (),
+    "no_pagination": ("viewstate", "table_no_pagination"),
+    "no_pagination_buttons": ("viewstate", "table_no_pagination_buttons"),
+    "no_pagination_button_text": ("viewstate", "table_no_pagination_button_text"),
+    "no_next_page_button": ("viewstate", "table_no_next_page_button"),
+}
 
 
 @pytest.fixture
-def make_mock_accumulator(
-    viewstate,
-    viewstate_no_value,
-    table_pg1,
-    table_pg4,
-    table_no_pagination,
-    table_no_pagination_buttons,
-    table_no_pagination_button_text,
-    table_no_next_page_button,
-):
+def make_mock_accumulator(request):
     def _make(name):
-        variants = {
-            "pg1": [viewstate, table_pg1],
-            "pg4": [viewstate, table_pg4],
-            "no_viewstate": [table_pg1],
-            "no_table": [viewstate],
-            "no_viewstate_value": [viewstate_no_value, table_pg1],
-            "empty": [],
-            "no_pagination": [viewstate, table_no_pagination],
-            "no_pagination_buttons": [viewstate, table_no_pagination_buttons],
-            "no_pagination_button_text": [viewstate, table_no_pagination_button_text],
-            "no_next_page_button": [viewstate, table_no_next_page_button],
-        }
+        # Only the fixtures of the requested variant are resolved.
+        elements = [
+            deepcopy(request.getfixturevalue(fixture))
+            for fixture in ACCUMULATOR_VARIANTS[name]
+        ]
         mock_accumulator = Mock()
-        mock_accumulator.aiter_feed = AsyncMock(return_value=deepcopy(variants[name]))
+        mock_accumulator.aiter_feed = AsyncMock(return_value=elements)
         return mock_accumulator
 
     return _make
@@ -256,24 +270,45 @@ async def test_raises_if_missing_viewstate_value(
         _ = await browser.launch()
 
 
-@pytest.mark.parametrize("attrname", ["current_page", "last_visible_page", "next_page"])
-def test_raises_if_not_launched(browser_factory, make_mock_accumulator, attrname):
+@pytest.mark.parametrize(
+    "attrname", ["table", "has_pagination", "current_page", "last_visible_page"]
+)
+def test_property_raises_if_not_launched(
+    browser_factory, make_mock_accumulator, attrname
+):
+    browser = browser_factory(make_mock_accumulator("pg1"))
+    exc_msg = "Method 'launch()' has not been called."
+    with pytest.raises(RuntimeError, match=re.escape(exc_msg)):
+        getattr(browser, attrname)
+
+
+@pytest.mark.asyncio
+async def test_next_page_raises_if_not_launched(browser_factory, make_mock_accumulator):
     browser = browser_factory(make_mock_accumulator("pg1"))
     exc_msg = "Method 'launch()' has not been called."
     with pytest.raises(RuntimeError, match=re.escape(exc_msg)):
-        getattr(browser, attrname).__call__()
+        await browser.next_page()
 
 
-@pytest.mark.parametrize("attrname", ["_extract_button_text", "next_page"])
+@pytest.mark.parametrize("attrname", ["current_page", "last_visible_page"])
 @pytest.mark.asyncio
-async def test_raises_if_missing_pagination(
+async def test_property_raises_if_missing_pagination(
     browser_factory, make_mock_accumulator, attrname
 ):
     browser = browser_factory(make_mock_accumulator("no_pagination"))
     await browser.launch()
-    attr = getattr(browser, attrname)
     with pytest.raises(ElementError, match=re.escape("Table has no pagination.")):
-        attr()
+        getattr(browser, attrname)
+
+
+@pytest.mark.asyncio
+async def test_next_page_raises_if_missing_pagination(
+    browser_factory, make_mock_accumulator
+):
+    browser = browser_factory(make_mock_accumulator("no_pagination"))
+    await browser.launch()
+    with pytest.raises(ElementError, match=re.escape("Table has no pagination.")):
+        await browser.next_page()
 
 
 @pytest.mark.parametrize(
@@ -335,16 +370,12 @@ async def test_next_page(make_mock_accumulator, browser_factory):
     browser = browser_factory(mock_accumulator)
     browser = await browser.launch()
 
-    _ = browser.current_page
-    _ = browser.last_visible_page
+    assert browser.current_page == "1"
+    assert browser.last_visible_page == "..."
 
-    assert all(x != "" for x in browser._button_texts.values())
     browser.accumulator = make_mock_accumulator("pg4")
     await browser.next_page()
 
-    # ensure cache reset
-    assert all(x == "" for x in browser._button_texts.values())
-
     # ensure new values are accurate
     assert browser.current_page == "4"
     assert browser.last_visible_page == "4"
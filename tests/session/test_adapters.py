@@ -1,6 +1,9 @@
 """Tests for `nobrakes.client._support`."""
 
 import importlib
+from itertools import cycle
+from operator import attrgetter
+import subprocess
 import sys
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
@@ -8,6 +11,7 @@ import aiohttp
 import pytest
 
 from nobrakes import client
+from nobrakes._constants import CHUNK_SIZE
 
 
 @pytest.mark.parametrize(
@@ -20,17 +24,43 @@ from nobrakes import client
     ],
 )
 def test_adapter_raises_if_missing_dependency(lib, class_name):
-    sys.modules.pop("nobrakes.client._support", None)
-    with patch.object(
-        importlib.util, "find_spec", lambda name: None if name == lib else "not_none"
+    module = importlib.import_module("nobrakes.client._support")
+
+    # Patching the module dict discards the lazily cached class afterwards.
+    with (
+        patch.dict(vars(module)),
+        patch.object(
+            importlib.util,
+            "find_spec",
+            lambda name: None if name == lib else "not_none",
+        ),
     ):
-        module = importlib.import_module("nobrakes.client._support")
+        vars(module).pop(class_name, None)
+        missing_class = getattr(module, class_name)
 
-    missing_class = getattr(module, class_name)
     with pytest.raises(ImportError, match=f"{class_name}.*{lib}"):
         missing_class()
 
 
+def test_import_defers_http_library_imports():
+    code = (
+        "import sys, nobrakes; print('aiohttp' in sys.modules, 'httpx' in sys.modules)"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    )
+    assert result.stdout.split() == ["False", "False"]
+
+
+@pytest.mark.parametrize("module_path", ["nobrakes.client", "nobrakes.client._support"])
+def test_dir_lists_adapters_once(module_path):
+    module = importlib.import_module(module_path)
+    _ = module.AIOHTTPSessionAdapter  # Cached in the module dict on first access.
+    names = dir(module)
+    assert len(names) == len(set(names))
+    assert "AIOHTTPSessionAdapter" in names
+
+
 @pytest.mark.parametrize("lib", ["aiohttp", "httpx"])
 def test_module_raises_if_missing_dependency(lib):
     module_path = f"nobrakes.client._support.{lib}"
@@ -95,6 +125,13 @@ class TestSessionAdapters:
         _ = client.AIOHTTPSessionAdapter(mock_session)
         assert type(mock_session._cookie_jar) is aiohttp.DummyCookieJar
 
+    @pytest.mark.asyncio
+    async def test_aiohttp_session_adapter_keeps_dummy_cookie_jar(self, mock_session):
+        jar = aiohttp.DummyCookieJar()
+        mock_session.cookie_jar = mock_session._cookie_jar = jar
+        _ = client.AIOHTTPSessionAdapter(mock_session)
+        assert mock_session._cookie_jar is jar
+
     def test_httpx_session_adapter_sets_dummy_cookie_jar(self, mock_session):
         _ = client.HTTPXSessionAdapter(mock_session)
         assert type(mock_session.cookies.jar) is client.DummyCookieJar
@@ -142,29 +179,25 @@ class TestResponseAdapters:
     @pytest.mark.parametrize(
         ("adapter_type", "method_name"),
         [
-            (client.AIOHTTPResponseAdapter, "iter_chunks"),
+            (client.AIOHTTPResponseAdapter, "iter_chunked"),
             (client.HTTPXResponseAdapter, "aiter_bytes"),
         ],
     )
     async def test_iter_chunks_returns_chunks_iterator(
         self, markup, adapter_type, method_name
     ):
-        def chunk_iterator(n=None):
+        def chunk_iterator(n):
             async def _iter():
-                if n is None:
-                    yield (markup, None) if method_name == "iter_chunks" else markup
-                else:
-                    for i in range(0, len(markup), n):
-                        yield markup[i : i + n]
+                for i in range(0, len(markup), n):
+                    yield markup[i : i + n]
 
             return _iter()
 
         mock_response = MagicMock()
 
-        if method_name == "iter_chunks":
+        if method_name == "iter_chunked":
             # aiohttp adapter
             mock_response.content = Mock()
-            mock_response.content.iter_chunks = chunk_iterator
             mock_response.content.iter_chunked = chunk_iterator
         else:
             # httpx adapter
@@ -175,6 +208,20 @@ class TestResponseAdapters:
         chunks = [chunk async for chunk in adapter.iter_chunks()]
         assert chunks == [markup]
 
+    @pytest.mark.parametrize(
+        ("adapter_type", "method_path"),
+        [
+            (client.AIOHTTPResponseAdapter, "content.iter_chunked"),
+            (client.HTTPXResponseAdapter, "aiter_bytes"),
+        ],
+    )
+    async def test_iter_chunks_passes_chunk_size(self, adapter_type, method_path):
+        mock_response = MagicMock()
+        adapter = adapter_type(mock_response)
+        adapter.iter_chunks()
+        method = attrgetter(method_path)(mock_response)
+        method.assert_called_once_with(CHUNK_SIZE)
+
     @pytest.mark.parametrize(
         "adapter_type",
         [client.AIOHTTPResponseAdapter, client.HTTPXResponseAdapter],
@@ -184,24 +231,51 @@ class TestResponseAdapters:
         expected_lines = markup.splitlines()
 
         def iter_lines(*_):
-            async def _str():
-                for line in expected_lines:
-                    yield line.decode()
-
-            async def _bytes():
+            async def _iter():
                 for line in expected_lines:
                     yield line
 
-            name = adapter_type.__name__
-            return _str() if name == "HTTPXResponseAdapter" else _bytes()
+            return _iter()
+
+        def iter_bytes(*_):
+            async def _iter():
+                # Small chunks ensure lines are split across chunk boundaries.
+                for i in range(0, len(markup), 7):
+                    yield markup[i : i + 7]
+
+            return _iter()
 
         if adapter_type.__name__ == "AIOHTTPResponseAdapter":
             mock_response.content = MagicMock()
             mock_response.content.__aiter__ = iter_lines
         else:
-            mock_response.aiter_lines = iter_lines
+            mock_response.aiter_bytes = iter_bytes
 
         adapter = adapter_type(mock_response)
 
         lines = [line async for line in adapter.iter_lines()]
         assert lines == markup.splitlines()
+
+    @pytest.mark.parametrize("line_break", [b"\n", b"\r", b"\r\n"])
+    async def test_httpx_iter_lines_joins_lines_spanning_chunks(self, line_break):
+        long_line = b"x" * (50 * CHUNK_SIZE + 3)
+        body = line_break.join([b"a", long_line, b"", b"b", long_line])
+
+        def iter_bytes(*_):
+            async def _iter():
+                # Uneven chunk sizes also split some "\r\n" pairs across chunks.
+                i = 0
+                for n in cycle([1, CHUNK_SIZE, 2, 7]):
+                    if i >= len(body):
+                        break
+                    yield body[i : i + n]
+                    i += n
+
+            return _iter()
+
+        mock_response = MagicMock()
+        mock_response.aiter_bytes = iter_bytes
+        adapter = client.HTTPXResponseAdapter(mock_response)
+
+        lines = [line async for line in adapter.iter_lines()]
+        assert lines == [b"a", long_line, b"", b"b", long_line]
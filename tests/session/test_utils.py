@@ -31,8 +31,8 @@ class TestSleepFuncs:
 
     async def test_with_jitter_executes_after_random_delay(self, mock_sleep):
         coro = AsyncMock(return_value="jitter")
-        with patch("random.uniform", return_value=0.42):
-            result = await with_jitter(0.0, 1.0, coro())
+        with patch("nobrakes.client._utils._random", return_value=0.5):
+            result = await with_jitter(1.0, 2.0, coro())
 
-        mock_sleep.assert_awaited_once_with(0.42)
+        mock_sleep.assert_awaited_once_with(1.5)
         assert result == "jitter"
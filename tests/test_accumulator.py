@@ -1,6 +1,7 @@
 """Tests for `nobrakes._accumulator`."""
 
 import re
+import threading
 
 from lxml import etree
 import pytest
@@ -87,6 +88,22 @@ async def test_expected_end_state_when_not_all_target_tags_exist(markup_aiter_ch
     assert acc.done is False
 
 
+@pytest.mark.asyncio
+async def test_aiter_feed_parses_on_event_loop_thread(monkeypatch, markup_aiter_chunks):
+    acc = ElementAccumulator(TagSignature("head"))
+    thread_ids = set()
+    handle_start = acc._handle_start
+
+    def spy(element):
+        thread_ids.add(threading.get_ident())
+        handle_start(element)
+
+    monkeypatch.setattr(acc, "_handle_start", spy)
+    _ = await acc.aiter_feed(markup_aiter_chunks)
+
+    assert thread_ids == {threading.get_ident()}
+
+
 @pytest.mark.parametrize("tag", ["html", "head", "body"])
 def test_expected_intermediate_state_when_all_target_tags_exist(markup, tag):
     target_tag = TagSignature(tag)
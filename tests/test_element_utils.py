@@ -214,6 +214,16 @@ class TestXPath:
         assert elem.tag == "div"
         assert elem.text == "One"
 
+    @pytest.mark.parametrize(
+        ("f", "selector", "v"),
+        [
+            (xpath.string, "string(//span[@id='single'])", "Hello"),
+            (xpath.string_list, "//div/text()", ["One", "Two"]),
+        ],
+    )
+    def test_func_accepts_compiled_xpath(self, markup, f, selector, v):
+        assert f(markup, etree.XPath(selector)) == v
+
     def test_first_element_e_raises_when_no_matches_are_found(self, markup):
         with pytest.raises(ElementError):
             xpath.first_element_e(markup, "//section")
@@ -3,6 +3,7 @@
 from collections.abc import Mapping
 import re
 from types import MappingProxyType
+from unittest.mock import patch
 
 import pytest
 
@@ -21,6 +22,23 @@ class TestHashableMapping:
         assert hm1 == hm2
         assert {hm1, hm2} == {hm1}
 
+    def test_hashable_mapping_caches_hash(self):
+        hm = HashableMapping({"a": 1, "b": 2})
+        expected = hash(frozenset(hm.items()))
+
+        with patch("nobrakes._models.frozenset", create=True) as mock_frozenset:
+            assert hash(hm) == hash(hm) == expected
+
+        mock_frozenset.assert_not_called()
+
+    def test_hashable_mapping_hash_not_compared_or_repr(self):
+        hm1 = HashableMapping({"a": 1})
+        hm2 = HashableMapping({"a": 1})
+        object.__setattr__(hm2, "_hash", hm1._hash + 1)
+
+        assert hm1 == hm2
+        assert "_hash" not in repr(hm1)
+
     def test_hashable_mapping_immutable_behavior(self):
         d = {"x": 42}
         hm = HashableMapping(d)